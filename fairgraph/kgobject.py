@@ -20,10 +20,11 @@ unique identifier (a URI).
 
 from __future__ import annotations
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from uuid import UUID
 from warnings import warn
-from typing import Any, Tuple, Dict, List, Optional, TYPE_CHECKING, Union
+from typing import Any, Callable, Iterator, Tuple, Dict, List, Optional, TYPE_CHECKING, Union
 
 from requests.exceptions import HTTPError, ConnectionError
 
@@ -410,7 +411,108 @@ class KGObject(KGNode, Releasable):
 
         """
         release_status = handle_scope_keyword(scope, release_status)
+        fetch_page = cls._page_fetcher(
+            client,
+            api=api,
+            release_status=release_status,
+            space=space,
+            follow_links=follow_links,
+            with_reverse_properties=with_reverse_properties,
+            filters=filters,
+        )
+        instances = fetch_page(from_index, size)
+        return [cls.from_jsonld(data=instance, release_status=release_status) for instance in instances]
+
+    @classmethod
+    def iter(
+        cls,
+        client: KGClient,
+        page_size: int = 100,
+        from_index: int = 0,
+        api: str = "auto",
+        release_status: str = "released",
+        scope: Optional[str] = None,
+        space: Optional[str] = None,
+        follow_links: Optional[Dict[str, Any]] = None,
+        with_reverse_properties: Optional[bool] = False,
+        **filters,
+    ) -> Iterator[KGObject]:
+        """
+        Iterate over all objects of this type in the Knowledge Graph, one page at a time.
+
+        Unlike :meth:`list`, which returns a single page of results, this generator
+        retrieves successive pages on demand, so memory use does not depend on the total
+        number of instances. While the objects from one page are being created and yielded,
+        the next page is retrieved in a background thread.
+
+        Args:
+            client: KGClient object that handles the communication with the KG.
+            page_size (int, optional): The number of instances to retrieve per request. Default is 100.
+            from_index (int, optional): The index of the first instance to return. Default is 0.
+            api (str): The KG API to use for the query. Can be 'query', 'core', or 'auto'. Default is 'auto'.
+            release_status (str, optional): The scope to use for the query. Can be 'released', 'in progress', or 'any'. Default is 'released'.
+            space (str, optional): The KG space to be queried. If not specified, results from all accessible spaces will be included.
+            follow_links (dict): The links in the graph to follow. Defaults to None.
+            with_reverse_properties (bool): Whether to include reverse properties. Defaults to False.
+            filters: Optional keyword arguments representing filters to apply to the query.
 
+        Yields:
+            Instances of this class, in the same order as they would be returned by :meth:`list`.
+
+        Example:
+
+            >>> from fairgraph.openminds.core import DatasetVersion
+            >>> for dsv in DatasetVersion.iter(client, page_size=50, space="dataset"):
+            ...     print(dsv.short_name)
+
+        """
+        if page_size < 1:
+            raise ValueError("'page_size' must be a positive integer")
+        release_status = handle_scope_keyword(scope, release_status)
+        fetch_page = cls._page_fetcher(
+            client,
+            api=api,
+            release_status=release_status,
+            space=space,
+            follow_links=follow_links,
+            with_reverse_properties=with_reverse_properties,
+            filters=filters,
+        )
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = executor.submit(fetch_page, from_index, page_size)
+            try:
+                while next_page is not None:
+                    instances = next_page.result()
+                    from_index += len(instances)
+                    if len(instances) < page_size:
+                        next_page = None
+                    else:
+                        # start retrieving the next page before processing this one
+                        next_page = executor.submit(fetch_page, from_index, page_size)
+                    for instance in instances:
+                        yield cls.from_jsonld(data=instance, release_status=release_status)
+            finally:
+                # if the consumer stops early, don't leave a request running in the background
+                if next_page is not None:
+                    next_page.cancel()
+
+    @classmethod
+    def _page_fetcher(
+        cls,
+        client: KGClient,
+        api: str,
+        release_status: str,
+        space: Optional[str],
+        follow_links: Optional[Dict[str, Any]],
+        with_reverse_properties: Optional[bool],
+        filters: Dict[str, Any],
+    ) -> Callable[[int, int], List[JSONdict]]:
+        """
+        Return a function which retrieves a single page of JSON-LD documents,
+        given the index of the first instance and the page size.
+
+        The query definition (if any) is generated once, and reused for every page.
+        """
         if api == "auto":
             if filters or follow_links:
                 api = "query"
@@ -425,23 +527,29 @@ class KGObject(KGNode, Releasable):
                 follow_links=follow_links,
                 with_reverse_properties=with_reverse_properties,
             )
-            instances = client.query(
-                query=query,
-                from_index=from_index,
-                size=size,
-                release_status=release_status,
-            ).data
+
+            def fetch_page(from_index: int, size: int) -> List[JSONdict]:
+                return client.query(
+                    query=query,
+                    from_index=from_index,
+                    size=size,
+                    release_status=release_status,
+                ).data
+
         elif api == "core":
             if filters:
                 raise ValueError("Cannot use filters with api='core'")
             if follow_links:
                 raise NotImplementedError("Following links with api='core' not yet implemented")
-            instances = client.list(
-                cls.type_, space=space, from_index=from_index, size=size, release_status=release_status
-            ).data
+
+            def fetch_page(from_index: int, size: int) -> List[JSONdict]:
+                return client.list(
+                    cls.type_, space=space, from_index=from_index, size=size, release_status=release_status
+                ).data
+
         else:
             raise ValueError("'api' must be either 'query', 'core', or 'auto'")
-        return [cls.from_jsonld(data=instance, release_status=release_status) for instance in instances]
+        return fetch_page
 
     @classmethod
     def count(
@@ -15,6 +15,8 @@ from fairgraph.caching import generate_cache_key
 from fairgraph.errors import CannotBuildExistenceQuery
 from fairgraph.base import ErrorHandling
 
+from test.utils import MockKGResponse
+
 import pytest
 
 
@@ -669,3 +671,48 @@ class TestKGProxy:
         uri = "https://kg.ebrains.eu/api/instances/00000000-0000-0000-0000-000000001234"
         proxy = KGProxy(MockKGObject, uri)
         assert repr(proxy) == 'KGProxy([MockKGObject], id="00000000-0000-0000-0000-000000001234")'
+
+
+class TestKGObjectIter:
+    class PagedClient:
+        """Serves JSON-LD documents in pages, recording the requests made"""
+
+        def __init__(self, n_instances):
+            self.documents = [
+                {
+                    "@id": f"{ID_NAMESPACE}00000000-0000-0000-0000-{i:012d}",
+                    "@type": MockKGObject2.type_,
+                    "https://openminds.ebrains.eu/vocab/A": i,
+                }
+                for i in range(n_instances)
+            ]
+            self.requests = []
+
+        def list(self, target_type, space=None, from_index=0, size=100, release_status="released"):
+            self.requests.append((from_index, size))
+            return MockKGResponse(self.documents[from_index : from_index + size])
+
+    def test_iter_yields_all_instances(self):
+        client = self.PagedClient(25)
+        objects = list(MockKGObject2.iter(client, page_size=10))
+        assert [obj.a for obj in objects] == list(range(25))
+        assert client.requests == [(0, 10), (10, 10), (20, 10)]
+
+    def test_iter_exact_multiple_of_page_size(self):
+        client = self.PagedClient(20)
+        objects = list(MockKGObject2.iter(client, page_size=10, from_index=5))
+        assert [obj.a for obj in objects] == list(range(5, 20))
+        assert client.requests == [(5, 10), (15, 10)]
+
+    def test_iter_is_lazy(self):
+        client = self.PagedClient(100)
+        iterator = MockKGObject2.iter(client, page_size=10)
+        first = next(iterator)
+        assert first.a == 0
+        iterator.close()
+        # only the first page and (at most) the prefetched second page were requested
+        assert len(client.requests) <= 2
+
+    def test_iter_invalid_page_size(self):
+        with pytest.raises(ValueError):
+            next(MockKGObject2.iter(self.PagedClient(5), page_size=0))